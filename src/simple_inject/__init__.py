@@ -1,6 +1,6 @@
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Dict, Literal, Optional
 
-from .core import Inject, SimpleInject
+from .core import DependencyNotFoundError, Inject, SimpleInject
 
 __simple_inject = SimpleInject()
 
@@ -21,6 +21,20 @@ def provide(key: str, value: Any, namespace: str = 'default'):
     __simple_inject.provide(key, value, namespace)
 
 
+def provide_many(items: Dict[str, Any], namespace: str = 'default'):
+    """
+    Provide several dependencies in the current context at once.
+
+    Parameters
+    ----------
+    items : Dict[str, Any]
+        Mapping of dependency keys to their values.
+    namespace : str, optional
+        The namespace for the dependencies (default is 'default').
+    """
+    __simple_inject.provide_many(items, namespace)
+
+
 def inject(
     key: str, namespace: str = 'default', if_not_found: Literal['none', 'raise'] = 'none'
 ) -> Any:
@@ -47,7 +61,40 @@ def inject(
     return __simple_inject.inject(key, namespace, if_not_found)
 
 
+def bind(namespace: str = 'default') -> Callable[[str], Any]:
+    """
+    Create an inject function bound to a namespace.
+
+    Parameters
+    ----------
+    namespace : str, optional
+        The namespace to inject from (default is 'default').
+
+    Returns
+    -------
+    Callable[[str], Any]
+        A function taking a key and returning its dependency, or None if it is
+        not found.
+    """
+    return __simple_inject.bind(namespace)
+
+
 def state(namespace: Optional[str] = None):
+    """
+    Get the state of the dependency injection context.
+
+    Parameters
+    ----------
+    namespace : str, optional
+        The namespace to get the state of. If not specified, the state of all
+        namespaces is returned.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]] or MappingProxyType[str, Any]
+        A snapshot copy of all namespaces, or a live read-only view of the
+        given namespace.
+    """
     return __simple_inject.state(namespace)
 
 
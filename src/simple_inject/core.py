@@ -1,20 +1,31 @@
 import inspect
-from collections import defaultdict
+import sys
 from contextvars import ContextVar
 from functools import wraps
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    List,
     Literal,
     Optional,
+    Set,
+    Tuple,
     TypeVar,
     get_type_hints,
 )
 
 T = TypeVar('T')
 
+_SENTINEL = object()
+
+
+def _intern(name: Any) -> Any:
+    """Intern string names so dict lookups can match them by identity."""
+    return sys.intern(name) if type(name) is str else name
+
 
 class DependencyNotFoundError(Exception):
     """Exception raised when a requested dependency is not found."""
@@ -25,16 +36,211 @@ class DependencyNotFoundError(Exception):
 class Inject(Generic[T]):
     """Marker class for injection."""
 
+    __slots__ = ('key', 'namespace')
+
     def __init__(self, key: str, namespace: str = 'default'):
-        self.key = key
-        self.namespace = namespace
+        self.key = _intern(key)
+        self.namespace = _intern(namespace)
+
+
+class _Context:
+    """
+    Dependency context of one scope.
+
+    Forking a context for a new scope copies only the namespace mapping. The
+    namespace dicts themselves are shared until either side writes to one, at
+    which point the writer copies it, so each scope still sees a snapshot.
+    """
+
+    __slots__ = ('namespaces', 'owned')
+
+    def __init__(self, namespaces: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.namespaces: Dict[str, Dict[str, Any]] = (
+            {} if namespaces is None else namespaces
+        )
+        # Namespaces whose dicts are not shared with any other context.
+        self.owned: Set[str] = set()
+
+    def fork(self) -> '_Context':
+        """Return a snapshot of this context for a new scope."""
+        # Every namespace dict becomes shared, so neither side owns it now.
+        self.owned = set()
+        return _Context(self.namespaces.copy())
+
+    def get(self, namespace: str) -> Optional[Dict[str, Any]]:
+        """Return the dependencies of `namespace`, or None if it is unknown."""
+        return self.namespaces.get(namespace)
+
+    def writable(self, namespace: str) -> Dict[str, Any]:
+        """Return the dependencies of `namespace`, owned by this context."""
+        if namespace in self.owned:
+            return self.namespaces[namespace]
+        deps = self.namespaces.get(namespace)
+        deps = {} if deps is None else deps.copy()
+        self.namespaces[namespace] = deps
+        self.owned.add(namespace)
+        return deps
+
+    def pop(self, namespace: str):
+        """Remove `namespace` from this context."""
+        self.namespaces.pop(namespace, None)
+        self.owned.discard(namespace)
+
+    def clear(self):
+        """Remove every namespace from this context."""
+        self.namespaces = {}
+        self.owned = set()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of every namespace and its dependencies."""
+        return {namespace: dict(deps) for namespace, deps in self.namespaces.items()}
+
+
+class _ScopeManager:
+    """Context manager that installs a snapshot of the current context."""
+
+    __slots__ = ('outer_self', 'token', 'previous_context')
+
+    def __init__(self, outer_self: 'SimpleInject'):
+        self.outer_self = outer_self
+        self.token = None
+        self.previous_context = None
+
+    def __enter__(self):
+        self.previous_context = self.outer_self._get_context()
+        self.token = self.outer_self._context.set(self.previous_context.fork())
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.outer_self._context.reset(self.token)
+
+
+def _resolve_inject_plan(func: Callable) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Resolve the parameters of `func` that should be injected.
+
+    Introspection is expensive, so this runs once at decoration time rather
+    than on every call.
+
+    Returns
+    -------
+    Tuple[Tuple[str, str, str], ...]
+        `(param_name, key, namespace)` for each parameter to inject.
+    """
+    sig = inspect.signature(func)
+    type_hints = get_type_hints(func)
+
+    inject_plan: List[Tuple[str, str, str]] = []
+    for param_name, param in sig.parameters.items():
+        annotation = type_hints.get(param_name, inspect.Parameter.empty)
+        if isinstance(annotation, type) and issubclass(annotation, Inject):
+            inject_instance = annotation()
+            inject_plan.append(
+                (param_name, inject_instance.key, inject_instance.namespace)
+            )
+        elif isinstance(param.default, Inject):
+            inject_plan.append((param_name, param.default.key, param.default.namespace))
+    return tuple(inject_plan)
+
+
+def _compile_inject_wrapper(
+    func: Callable,
+    plan: Tuple[Tuple[str, str, str], ...],
+    inject: Callable[[str, str], Any],
+) -> Optional[Callable]:
+    """
+    Generate a wrapper for `func` that mirrors its signature.
+
+    Injected parameters default to a sentinel and are resolved only when the
+    caller did not pass them, positionally or by keyword. The wrapper body is
+    straight-line code, so calls skip the generic `**kwargs` loop.
+
+    Returns
+    -------
+    Optional[Callable]
+        The wrapper, or None if the signature cannot be reproduced (e.g. `func`
+        wraps another function, or an injected parameter is followed by a
+        positional one without default).
+    """
+    # inspect.signature follows __wrapped__, but the wrapper forwards its
+    # arguments to `func` itself, so wrapped callables are not specialised.
+    if inspect.unwrap(func) is not func:
+        return None
+    params = list(inspect.signature(func).parameters.values())
+    if any(param.name.startswith('_si_') for param in params):
+        return None
+
+    namespace: Dict[str, Any] = {
+        '_si_func': func,
+        '_si_inject': inject,
+        '_si_missing': _SENTINEL,
+    }
+    injected = {param_name: i for i, (param_name, _, _) in enumerate(plan)}
+    for i, (_, key, ns) in enumerate(plan):
+        namespace[f'_si_key{i}'] = key
+        namespace[f'_si_ns{i}'] = ns
+
+    signature: List[str] = []
+    call: List[str] = []
+    body: List[str] = []
+    for i, param in enumerate(params):
+        name = param.name
+        if param.kind is param.VAR_POSITIONAL:
+            signature.append(f'*{name}')
+            call.append(f'*{name}')
+            continue
+        if param.kind is param.VAR_KEYWORD:
+            signature.append(f'**{name}')
+            call.append(f'**{name}')
+            continue
+
+        if param.kind is param.KEYWORD_ONLY and not any(
+            arg.startswith('*') for arg in signature
+        ):
+            signature.append('*')
+
+        if name in injected:
+            index = injected[name]
+            signature.append(f'{name}=_si_missing')
+            body.append(
+                f'    if {name} is _si_missing:\n'
+                f'        {name} = _si_inject(_si_key{index}, _si_ns{index})\n'
+            )
+        elif param.default is not param.empty:
+            namespace[f'_si_default{i}'] = param.default
+            signature.append(f'{name}=_si_default{i}')
+        else:
+            signature.append(name)
+
+        if param.kind is param.KEYWORD_ONLY:
+            call.append(f'{name}={name}')
+        else:
+            call.append(name)
+
+        if param.kind is param.POSITIONAL_ONLY and (
+            i + 1 == len(params) or params[i + 1].kind is not param.POSITIONAL_ONLY
+        ):
+            signature.append('/')
+
+    source = (
+        f'def wrapper({", ".join(signature)}):\n'
+        + ''.join(body)
+        + f'    return _si_func({", ".join(call)})\n'
+    )
+    try:
+        exec(source, namespace)
+    except SyntaxError:
+        return None
+    return namespace['wrapper']
 
 
 class SimpleInject:
     def __init__(self):
-        self._context: ContextVar[Dict[str, Dict[str, Any]]] = ContextVar(
-            'context', default=defaultdict(dict)
+        self._context: ContextVar[_Context] = ContextVar(
+            'context', default=_Context()
         )
+        # Bound once: every provide/inject reads the context, and this saves
+        # an attribute lookup on each of those calls.
+        self._get_context = self._context.get
 
     def provide(self, key: str, value: Any, namespace: str = 'default'):
         """
@@ -49,9 +255,29 @@ class SimpleInject:
         namespace : str, optional
             The namespace for the dependency (default is 'default').
         """
-        context = self._context.get()
-        context[namespace][key] = value
-        self._context.set(context)
+        # The context is mutated in place; calling `_context.set` again with
+        # the same object would only allocate a new Token. A new context is
+        # installed solely when entering a scope.
+        # Stored names are interned so lookups with string literals, which
+        # are interned by the compiler, match by identity.
+        context = self._get_context()
+        context.writable(_intern(namespace))[_intern(key)] = value
+
+    def provide_many(self, items: Dict[str, Any], namespace: str = 'default'):
+        """
+        Provide several dependencies in the current context at once.
+
+        Parameters
+        ----------
+        items : Dict[str, Any]
+            Mapping of dependency keys to their values.
+        namespace : str, optional
+            The namespace for the dependencies (default is 'default').
+        """
+        context = self._get_context()
+        context.writable(_intern(namespace)).update(
+            {_intern(key): value for key, value in items.items()}
+        )
 
     def inject(
         self,
@@ -83,16 +309,46 @@ class SimpleInject:
         DependencyNotFoundError
             If the requested dependency is not found in the given namespace.
         """
-        context = self._context.get()
-        if key in context[namespace]:
-            return context[namespace][key]
-        elif if_not_found == 'none':
+        context = self._get_context()
+        deps = context.get(namespace)
+        if deps is not None:
+            value = deps.get(key, _SENTINEL)
+            if value is not _SENTINEL:
+                return value
+        if if_not_found == 'none':
             return None
         else:
             raise DependencyNotFoundError(
                 f"Dependency '{key}' not found in namespace '{namespace}'"
             )
 
+    def bind(self, namespace: str = 'default') -> Callable[[str], Any]:
+        """
+        Create an inject function bound to a namespace.
+
+        The returned function reads the current context on every call, so it
+        follows scopes like `inject` does, but skips argument handling.
+
+        Parameters
+        ----------
+        namespace : str, optional
+            The namespace to inject from (default is 'default').
+
+        Returns
+        -------
+        Callable[[str], Any]
+            A function taking a key and returning its dependency, or None if
+            it is not found.
+        """
+        get_context = self._get_context
+        namespace = _intern(namespace)
+
+        def inject_from(key: str) -> Any:
+            deps = get_context().get(namespace)
+            return None if deps is None else deps.get(key)
+
+        return inject_from
+
     def state(self, namespace: Optional[str] = None):
         """Get the state of the dependency injection context.
 
@@ -105,13 +361,16 @@ class SimpleInject:
         Returns
         ----------
         - `Dict[str, Dict[str, Any]]`
-            - The state of the dependency injection context.
+            - If `namespace` is not specified, a snapshot copy of all namespaces.
+        - `MappingProxyType[str, Any]`
+            - If `namespace` is specified, a live read-only view of that namespace.
         """
-        all_context = self._context.get()
+        all_context = self._get_context()
         if namespace is None:
-            return dict(all_context)
+            return all_context.to_dict()
         else:
-            return all_context[namespace]
+            deps = all_context.get(namespace)
+            return MappingProxyType({} if deps is None else deps)
 
     def create_scope(self):
         """
@@ -119,27 +378,10 @@ class SimpleInject:
 
         Returns
         -------
-        ScopeManager
+        _ScopeManager
             A context manager for the new dependency scope.
         """
-
-        class ScopeManager:
-            def __init__(self, outer_self):
-                self.outer_self = outer_self
-                self.token = None
-                self.previous_context = None
-
-            def __enter__(self):
-                self.previous_context = self.outer_self._context.get()
-                new_context = defaultdict(dict)
-                for namespace, deps in self.previous_context.items():
-                    new_context[namespace] = deps.copy()
-                self.token = self.outer_self._context.set(new_context)
-
-            def __exit__(self, exc_type, exc_value, traceback):
-                self.outer_self._context.reset(self.token)
-
-        return ScopeManager(self)
+        return _ScopeManager(self)
 
     def scoped(self):
         """
@@ -151,11 +393,18 @@ class SimpleInject:
             A decorator function that creates a new dependency scope.
         """
 
+        context_var = self._context
+
         def decorator(func):
+            # Same as `with self.create_scope()`, without allocating a
+            # _ScopeManager on every call.
             @wraps(func)
             def wrapper(*args, **kwargs):
-                with self.create_scope():
+                token = context_var.set(context_var.get().fork())
+                try:
                     return func(*args, **kwargs)
+                finally:
+                    context_var.reset(token)
 
             return wrapper
 
@@ -172,34 +421,38 @@ class SimpleInject:
         namespace : str, optional
             The namespace to purge. If not specified, all dependencies are purged.
         """
-        context = self._context.get()
+        context = self._get_context()
         if namespace is not None:
-            context[namespace].clear()
+            context.pop(namespace)
         else:
             context.clear()
-        self._context.set(context)
 
     def auto_inject(self):
         def decorator(func: Callable) -> Callable:
+            inject = self.inject
+            try:
+                plan = _resolve_inject_plan(func)
+            except NameError:
+                # Forward references may not be defined yet while the module
+                # or class body is still executing; resolve on the first call.
+                plan = None
+            else:
+                if not plan:
+                    return func
+
+                compiled = _compile_inject_wrapper(func, plan, inject)
+                if compiled is not None:
+                    return wraps(func)(compiled)
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                sig = inspect.signature(func)
-                type_hints = get_type_hints(func)
-
-                for param_name, param in sig.parameters.items():
-                    if param_name in kwargs:
-                        continue
-
-                    annotation = type_hints.get(param_name, inspect.Parameter.empty)
-                    if isinstance(annotation, type) and issubclass(annotation, Inject):
-                        inject_instance = annotation()
-                        kwargs[param_name] = self.inject(
-                            inject_instance.key, inject_instance.namespace
-                        )
-                    elif isinstance(param.default, Inject):
-                        kwargs[param_name] = self.inject(
-                            param.default.key, param.default.namespace
-                        )
+                nonlocal plan
+                if plan is None:
+                    plan = _resolve_inject_plan(func)
+
+                for param_name, key, namespace in plan:
+                    if param_name not in kwargs:
+                        kwargs[param_name] = inject(key, namespace)
 
                 return func(*args, **kwargs)
 
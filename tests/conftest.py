@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+import pytest
+
+from simple_inject import purge
+
+
+@dataclass(frozen=True)
+class GlobalConfig:
+    app_name: str
+    version: str
+
+
+@pytest.fixture(scope='session')
+def global_config():
+    # Built once per session; the per-test fixtures only re-provide it.
+    return GlobalConfig(app_name='MyApp', version='1.0')
+
+
+@pytest.fixture(autouse=True)
+def clear_dependencies():
+    yield
+    # Cleanup: Purge all dependencies after each test
+    purge()
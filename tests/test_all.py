@@ -1,15 +1,26 @@
+import json
+import threading
+from contextlib import ExitStack
+
 import pytest
 
-from simple_inject import create_scope, inject, provide, purge, scoped
+from simple_inject import (
+    DependencyNotFoundError,
+    bind,
+    create_scope,
+    inject,
+    provide,
+    provide_many,
+    purge,
+    scoped,
+    state,
+)
 
 
 @pytest.fixture(autouse=True)
-def setup_and_cleanup():
-    # Setup: Provide a global configuration
-    provide('global_config', {'app_name': 'MyApp', 'version': '1.0'})
-    yield
-    # Cleanup: Purge all dependencies after each test
-    purge()
+def setup_global_config(global_config):
+    # Setup: Provide the session-wide global configuration
+    provide('global_config', global_config)
 
 
 def test_provide_and_inject_basic():
@@ -34,10 +45,49 @@ def test_inject_nonexistent_key():
     """
     Test that injecting a non-existent key raises a DependencyNotFoundError.
     """
-    with pytest.raises(Exception):  # Replace with the actual exception class if known
+    with pytest.raises(DependencyNotFoundError):
         inject('nonexistent_key', if_not_found='raise')
 
 
+def test_provide_many():
+    """
+    Test that provide_many provides several dependencies in one namespace.
+    """
+    provide('key1', 'old_value', namespace='ns1')
+    provide_many({'key1': 'value1', 'key2': 'value2'}, namespace='ns1')
+    assert inject('key1', namespace='ns1') == 'value1'
+    assert inject('key2', namespace='ns1') == 'value2'
+    with create_scope():
+        provide_many({'key2': 'inner_value2'}, namespace='ns1')
+        assert inject('key1', namespace='ns1') == 'value1'
+        assert inject('key2', namespace='ns1') == 'inner_value2'
+    assert inject('key2', namespace='ns1') == 'value2'
+
+
+def test_state():
+    """
+    Test that state returns a snapshot of all namespaces and a read-only view
+    of a single namespace.
+    """
+    provide('key', 'value', namespace='ns1')
+    assert state('ns1')['key'] == 'value'
+    assert dict(state('missing')) == {}
+    with pytest.raises(TypeError):
+        state('ns1')['key'] = 'other_value'
+
+    snapshot = state()
+    assert type(snapshot) is dict and type(snapshot['ns1']) is dict
+    assert json.loads(json.dumps(snapshot['ns1'])) == {'key': 'value'}
+    snapshot['ns1']['key'] = 'other_value'
+    assert inject('key', namespace='ns1') == 'value'
+
+    with create_scope():
+        provide('key', 'inner_value', namespace='ns1')
+        assert state('ns1')['key'] == 'inner_value'
+        assert state()['ns1']['key'] == 'inner_value'
+    assert state('ns1')['key'] == 'value'
+
+
 def test_create_scope():
     """
     Test that create_scope creates an isolated scope for dependencies.
@@ -63,6 +113,63 @@ def test_nested_scopes():
     assert inject('key') == 'outer_value'
 
 
+def test_scopes_entered_with_exit_stack():
+    """
+    Test that several scopes can be entered and exited together.
+    """
+    provide('key', 'outer_value')
+    with ExitStack() as stack:
+        for namespace in ('database', 'user_service', 'auth_service'):
+            stack.enter_context(create_scope())
+            provide('key', f'{namespace}_value', namespace=namespace)
+        provide('key', 'inner_value')
+        assert inject('key', namespace='database') == 'database_value'
+        assert inject('key', namespace='auth_service') == 'auth_service_value'
+        assert inject('key') == 'inner_value'
+    assert inject('key') == 'outer_value'
+    assert inject('key', namespace='database') is None
+
+
+def test_scope_is_snapshot_of_outer_context():
+    """
+    Test that writes to the outer context after a scope is entered are not
+    visible inside the scope, even from another thread.
+    """
+    provide('key', 'before')
+    entered = threading.Event()
+    provided = threading.Event()
+    seen = []
+
+    def worker():
+        with create_scope():
+            entered.set()
+            provided.wait()
+            seen.append(inject('key'))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    entered.wait()
+    provide('key', 'after')
+    provided.set()
+    thread.join()
+    assert seen == ['before']
+    assert inject('key') == 'after'
+
+
+def test_deeply_nested_scopes():
+    """
+    Test that state() works however deeply scopes are nested.
+    """
+    provide('key', 'outer_value')
+    with ExitStack() as stack:
+        for _ in range(3000):
+            stack.enter_context(create_scope())
+        provide('key', 'inner_value')
+        assert state('default')['key'] == 'inner_value'
+        assert state()['default']['key'] == 'inner_value'
+    assert inject('key') == 'outer_value'
+
+
 def test_scoped_decorator():
     """
     Test that the scoped decorator creates an isolated scope for a function.
@@ -120,8 +227,8 @@ def test_global_config_fixture():
     Test that the global_config provided by the fixture is accessible.
     """
     config = inject('global_config')
-    assert config['app_name'] == 'MyApp'
-    assert config['version'] == '1.0'
+    assert config.app_name == 'MyApp'
+    assert config.version == '1.0'
 
 
 def test_provide_overwrites_existing_value():
@@ -141,3 +248,35 @@ def test_scope_isolation_between_tests():
     with pytest.raises(Exception):
         inject('key_from_previous_test', if_not_found='raise')
     provide('key_for_next_test', 'value')
+
+
+def test_purge_inside_scope():
+    """
+    Test that purging inside a scope does not affect the outer scope.
+    """
+    provide('key1', 'value1', namespace='ns1')
+    provide('key2', 'value2', namespace='ns2')
+    with create_scope():
+        purge(namespace='ns1')
+        assert inject('key1', namespace='ns1') is None
+        assert inject('key2', namespace='ns2') == 'value2'
+        purge()
+        assert inject('key2', namespace='ns2') is None
+        provide('key2', 'inner_value2', namespace='ns2')
+        assert inject('key2', namespace='ns2') == 'inner_value2'
+    assert inject('key1', namespace='ns1') == 'value1'
+    assert inject('key2', namespace='ns2') == 'value2'
+
+
+def test_provide_non_str_key():
+    """
+    Test that non-str keys, including str subclasses, can be provided.
+    """
+
+    class Name(str):
+        pass
+
+    provide(1, 'one')
+    provide(Name('key'), 'value', namespace=Name('ns1'))
+    assert inject(1) == 'one'
+    assert inject('key', namespace='ns1') == 'value'
@@ -1,11 +1,19 @@
+import gc
+import logging
+import weakref
+from dataclasses import dataclass
+from functools import wraps
+
 import pytest  # Added import for pytest
 
-from simple_inject import Inject, auto_inject, create_scope, inject, provide
+from simple_inject import Inject, auto_inject, create_scope, inject, provide, purge
+
+logger = logging.getLogger(__name__)
 
 
 class Engine:
     def start(self):
-        print('Engine started')
+        logger.debug('Engine started')
 
 
 class InjectEngine(Inject[Engine]):
@@ -16,13 +24,13 @@ class InjectEngine(Inject[Engine]):
 @auto_inject()
 def f1(arg1, arg2, *, engine: InjectEngine):
     engine.start()
-    print(f'f1 called with {arg1}, {arg2}')
+    logger.debug('f1 called with %s, %s', arg1, arg2)
 
 
 @auto_inject()
 def f2(arg1, arg2, engine: Engine = Inject('engine')):
     engine.start()
-    print(f'f2 called with {arg1}, {arg2}')
+    logger.debug('f2 called with %s, %s', arg1, arg2)
 
 
 @pytest.fixture  # Added pytest fixture for setup
@@ -38,3 +46,116 @@ def test_f1(setup_engine):  # Test for f1
 
 def test_f2(setup_engine):  # Test for f2
     f2('foo', 'bar')  # You can add assertions as needed
+
+
+def test_no_injected_params():
+    def plain(arg1, arg2=None):
+        return arg1, arg2
+
+    assert auto_inject()(plain) is plain
+
+
+def test_explicit_engine_overrides_injection(setup_engine):
+    @auto_inject()
+    def f3(arg1, engine: Engine = Inject('engine'), *args, **kwargs):
+        return engine, args, kwargs
+
+    engine = Engine()
+    assert f3('foo', engine) == (engine, (), {})
+    assert f3('foo', engine=engine, extra=1) == (engine, (), {'extra': 1})
+    assert f3('foo')[0] is inject('engine')
+
+
+def test_injected_param_before_required_param(setup_engine):
+    @auto_inject()
+    def f4(engine: InjectEngine, arg1):
+        return engine, arg1
+
+    assert f4(arg1='foo') == (inject('engine'), 'foo')
+
+
+def test_subscripted_inject_marker():
+    marker = Inject[Engine]('engine', namespace='ns1')
+    assert (marker.key, marker.namespace) == ('engine', 'ns1')
+    assert InjectEngine().key == 'engine'
+
+
+def test_injection_follows_context_changes():
+    @auto_inject()
+    def f5(engine: InjectEngine):
+        return engine
+
+    assert f5() is None
+    first = Engine()
+    provide('engine', first)
+    assert f5() is first
+    assert f5() is first
+
+    second = Engine()
+    with create_scope():
+        assert f5() is first
+        provide('engine', second)
+        assert f5() is second
+    assert f5() is first
+
+    purge()
+    assert f5() is None
+
+
+def test_unhashable_callable(setup_engine):
+    @dataclass
+    class Driver:
+        car: str
+
+        def __call__(self, engine: Engine = Inject('engine')):
+            return self.car, engine
+
+    driver = auto_inject()(Driver('Tesla'))
+    assert driver() == ('Tesla', inject('engine'))
+
+
+def test_auto_inject_over_wrapped_function(setup_engine):
+    def with_context(func):
+        @wraps(func)
+        def wrapper(ctx, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @auto_inject()
+    @with_context
+    def f6(arg1, engine: Engine = Inject('engine')):
+        return arg1, engine
+
+    assert f6('ctx', 1) == (1, inject('engine'))
+
+
+def test_scope_dependencies_released_after_exit():
+    @auto_inject()
+    def f7(engine: InjectEngine):
+        return engine
+
+    with create_scope():
+        engine = Engine()
+        engine_ref = weakref.ref(engine)
+        provide('engine', engine)
+        assert f7() is engine
+        del engine
+    gc.collect()
+    assert engine_ref() is None
+
+
+def test_default_with_raising_eq(setup_engine):
+    class Strict:
+        def __eq__(self, other):
+            raise ValueError('ambiguous comparison')
+
+        __hash__ = object.__hash__
+
+    strict = Strict()
+
+    @auto_inject()
+    def f8(option=strict, engine: Engine = Inject('engine')):
+        return option, engine
+
+    assert f8() == (strict, inject('engine'))
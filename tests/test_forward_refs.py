@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from simple_inject import Inject, auto_inject, provide
+
+
+class Engine:
+    pass
+
+
+@auto_inject()
+def build(part: Later = None, engine: Engine = Inject('engine')):
+    return part, engine
+
+
+class Later:
+    pass
+
+
+class Car:
+    @auto_inject()
+    def clone(self, engine: Engine = Inject('engine')) -> Car:
+        car = Car()
+        car.engine = engine
+        return car
+
+
+def test_forward_reference_to_later_class():
+    engine = Engine()
+    provide('engine', engine)
+    part = Later()
+    assert build(part) == (part, engine)
+    assert build() == (None, engine)
+
+
+def test_forward_reference_to_enclosing_class():
+    engine = Engine()
+    provide('engine', engine)
+    assert Car().clone().engine is engine
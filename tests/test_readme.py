@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 from simple_inject import (
@@ -10,11 +12,7 @@ from simple_inject import (
     scoped,
 )
 
-
-@pytest.fixture(autouse=True)
-def clear_dependencies():
-    yield
-    purge()
+logger = logging.getLogger(__name__)
 
 
 def test_basic_provide_and_inject():
@@ -96,7 +94,7 @@ class InjectEngine(Inject[Engine]):
 @auto_inject()
 def drive(car: str, engine: Engine = Inject('engine')):
     tip = f'驾驶 {car}: {engine.start()}'
-    print(tip)
+    logger.debug(tip)
     return tip
 
 